@@ -1,15 +1,61 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime, date
-import json
+import io
 import os
+from types import MappingProxyType
 from data_manager import DataManager
 from stats_calculator import StatsCalculator
 from mlb_api_client import MLBApiClient
 from auth_manager import AuthManager
 
+# Box score table layout
+REQUIRED_BATTING_COLUMNS = ('name', 'order', 'sub', 'position')
+BATTING_COLUMNS_ORDER = ('at_bats', 'hits', 'runs', 'rbis', 'doubles', 'triples', 'home_runs',
+                         'walks', 'strikeouts', 'stolen_bases', 'caught_stealing')
+BATTING_COLUMN_NAMES = MappingProxyType({
+    'at_bats': 'AB',
+    'hits': 'H',
+    'runs': 'R',
+    'rbis': 'RBI',
+    'doubles': '2B',
+    'triples': '3B',
+    'home_runs': 'HR',
+    'walks': 'BB',
+    'strikeouts': 'SO',
+    'stolen_bases': 'SB',
+    'caught_stealing': 'CS'
+})
+PITCHING_COLUMNS_ORDER = ('name', 'innings_pitched', 'hits_allowed', 'runs_allowed',
+                          'earned_runs', 'walks', 'strikeouts', 'home_runs_allowed')
+
+BATTING_STAT_COLUMNS = BATTING_COLUMNS_ORDER + ('gidp', 'errors', 'lob')
+
+# Box score columns summed for the Game Notes section
+GAME_NOTE_TOTALS = ['doubles', 'triples', 'home_runs', 'stolen_bases', 'caught_stealing',
+                    'gidp', 'errors', 'lob', 'hits']
+# Singles count once, so TB = H + 2B + 2*3B + 3*HR
+TOTAL_BASE_WEIGHTS = pd.Series({'hits': 1, 'doubles': 1, 'triples': 2, 'home_runs': 3})
+GAME_NOTE_LABELS = (('2B', 'doubles'), ('3B', 'triples'), ('HR', 'home_runs'), ('SB', 'stolen_bases'),
+                    ('CS', 'caught_stealing'), ('GIDP', 'gidp'), ('E', 'errors'))
+
+# Set MLB_DEBUG=1 to show debug output in the UI
+DEBUG = bool(os.environ.get('MLB_DEBUG'))
+
+# Number of game cards shown per page on My Games
+GAMES_PER_PAGE = 12
+# Caches keyed on (user_id, version) never see an old version again, so cap them
+VERSIONED_CACHE_ENTRIES = 64
+
+@st.cache_resource
+def get_mlb_client():
+    return MLBApiClient()
+
+@st.cache_resource
+def get_stats_calculator():
+    return StatsCalculator()
+
 def main():
     st.set_page_config(
         page_title="Baseball Statistics Aggregator",
@@ -51,10 +97,6 @@ def main():
         # Initialize user-specific session state
         if 'data_manager' not in st.session_state or st.session_state.data_manager.user_id != user:
             st.session_state.data_manager = DataManager(user_id=user)
-        if 'stats_calculator' not in st.session_state:
-            st.session_state.stats_calculator = StatsCalculator()
-        if 'mlb_client' not in st.session_state:
-            st.session_state.mlb_client = MLBApiClient()
 
         # Sidebar with logout
         st.sidebar.write(f"Logged in as: {user}")
@@ -68,12 +110,8 @@ def main():
             st.session_state.page = "Add Game"
 
         pages = ["Add Game", "My Games", "Player Stats", "Dashboard", "Export Data"]
-        for p in pages:
-            if st.sidebar.button(p, use_container_width=True):
-                st.session_state.page = p
-                st.rerun()
-
-        page = st.session_state.page
+        # The radio is bound to st.session_state.page, so a click is a single rerun
+        page = st.sidebar.radio("Navigation", pages, key="page")
 
         if page == "Add Game":
             add_game_page()
@@ -86,6 +124,20 @@ def main():
         elif page == "Export Data":
             export_data_page()
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_teams():
+    return get_mlb_client().get_teams()
+
+@st.cache_data(show_spinner=False)
+def _team_index(teams_key):
+    labels = [f"{name} ({abbreviation})" for name, abbreviation, _ in teams_key]
+    return labels, dict(zip(labels, (team_id for _, _, team_id in teams_key)))
+
+def _fetch_game(home_team_id, away_team_id, game_date):
+    # No app-level cache: the client caches schedules and box scores by game
+    # status, so a game that is still in progress is never pinned as final
+    return get_mlb_client().get_game_data(home_team_id, away_team_id, game_date)
+
 def add_game_page():
     st.header("Add New Game")
     
@@ -93,22 +145,24 @@ def add_game_page():
     
     with col1:
         # Get list of MLB teams
-        teams = st.session_state.mlb_client.get_teams()
+        teams = _load_teams()
         if teams:
-            team_options = {f"{team['name']} ({team['abbreviation']})": team['id'] for team in teams}
+            team_labels, team_options = _team_index(tuple((team['name'], team['abbreviation'], team['id']) for team in teams))
             
             home_team = st.selectbox(
                 "Home Team",
-                options=list(team_options.keys()),
+                options=team_labels,
                 help="Select the home team"
             )
             
             away_team = st.selectbox(
                 "Away Team", 
-                options=list(team_options.keys()),
+                options=team_labels,
                 help="Select the away team"
             )
         else:
+            # Don't keep a failed lookup cached for the whole TTL
+            _load_teams.clear()
             st.error("Unable to load team data. Please check your connection.")
             return
     
@@ -126,18 +180,17 @@ def add_game_page():
         )
     
     if st.button("Add Game", type="primary"):
+        # Reject identical teams before any lookups or API work
+        if home_team == away_team:
+            st.error("Home and away teams cannot be the same!")
+            st.stop()
         if home_team and away_team and game_date:
-            if home_team == away_team:
-                st.error("Home and away teams cannot be the same!")
-                return
             home_team_id = team_options[home_team]
             away_team_id = team_options[away_team]
             with st.spinner("Fetching game data from MLB API..."):
-                game_data = st.session_state.mlb_client.get_game_data(
-                    home_team_id, away_team_id, game_date
-                )
+                game_data = _fetch_game(home_team_id, away_team_id, game_date)
                 # Box score is already included in game_data from get_game_data
-                if game_data:
+                if game_data and DEBUG:
                     st.write("Debug - Game data structure:", list(game_data.keys()))
             if game_data:
                 # Save the game
@@ -153,24 +206,193 @@ def add_game_page():
             else:
                 st.error("No game found for the selected teams and date. Please verify the details.")
 
+def _get_games():
+    """Games for the current user, refreshed from the DataManager when its version changes"""
+    data_manager = st.session_state.data_manager
+    if st.session_state.get('games_version') != data_manager.version:
+        st.session_state.games_cache = data_manager.get_all_games()
+        st.session_state.games_version = data_manager.version
+    return st.session_state.games_cache
+
+def _games_signature():
+    """Cache key for the current user's games; DataManager bumps its version on every mutation"""
+    data_manager = st.session_state.data_manager
+    return (data_manager.user_id, data_manager.version)
+
+# The leading underscore keeps Streamlit from hashing the full games list;
+# the signature stands in for it as the cache key
+@st.cache_data(max_entries=VERSIONED_CACHE_ENTRIES, show_spinner=False)
+def _aggregate_stats(sig, _games):
+    return get_stats_calculator().calculate_aggregate_stats(_games)
+
+def _downcast_counts(df):
+    """Shrink integer counting stats to the smallest integer dtype that holds them"""
+    int_columns = df.select_dtypes('integer').columns
+    if len(int_columns):
+        df[int_columns] = df[int_columns].apply(pd.to_numeric, downcast='integer')
+    return df
+
+@st.cache_data(max_entries=VERSIONED_CACHE_ENTRIES, show_spinner=False)
+def _stats_frames(sig, _games):
+    batting_stats, pitching_stats = _aggregate_stats(sig, _games)
+    return _downcast_counts(pd.DataFrame(batting_stats)), _downcast_counts(pd.DataFrame(pitching_stats))
+
+@st.cache_data(max_entries=VERSIONED_CACHE_ENTRIES, show_spinner=False)
+def _games_frame(sig, _games):
+    """Summary columns of every game (no box scores) for the dashboard tables"""
+    games_df = pd.DataFrame(_games, columns=['date', 'home_team', 'away_team', 'home_score', 'away_score'])
+    # Share one categorical dtype for both team columns so downstream counts and
+    # groupbys work on integer codes instead of hashing team names
+    team_dtype = pd.CategoricalDtype(pd.unique(pd.concat([games_df['home_team'], games_df['away_team']]).dropna()))
+    games_df['home_team'] = games_df['home_team'].astype(team_dtype)
+    games_df['away_team'] = games_df['away_team'].astype(team_dtype)
+    return games_df
+
+def _format_player_names(batting):
+    """Build the "Player" display column, indenting substitutes under their starters"""
+    order = pd.to_numeric(batting['order'], errors='coerce')
+    is_sub = batting['sub'].fillna(False).astype(bool)
+    position = batting['position'].fillna('').astype(str)
+    name = batting['name'].fillna('Unknown').astype(str)
+
+    prefix = pd.Series(np.where(is_sub, "    ", ""), index=batting.index)  # Four spaces for indentation
+    order_str = (order.fillna(0).astype(int).astype(str) + ". ").where(~is_sub & order.notna(), "")
+    pos_str = (" (" + position + ")").where(position != "", "")
+    return prefix + order_str + name + pos_str
+
+def _order_with_subs(batting):
+    """Sort by batting order and place each substitute right after the starter at their position"""
+    batting = batting.sort_values(by=['order'], na_position='last', kind='mergesort')
+    is_sub = batting['sub'].fillna(False).astype(bool)
+    position = batting['position']
+
+    # Each starter keeps its slot; a sub takes the slot of the starter at its
+    # position, and unmatched subs go to the end
+    slot = pd.Series(np.arange(len(batting), dtype=float), index=batting.index)
+    starters = ~is_sub & position.notna() & (position != '')
+    starter_slot = slot[starters].groupby(position[starters]).last()
+    slot = slot.where(~is_sub, position.map(starter_slot)).fillna(np.inf)
+
+    # lexsort is stable, so ties keep their batting-order sequence
+    return batting.iloc[np.lexsort((is_sub.to_numpy(), slot.to_numpy()))].reset_index(drop=True)
+
+def _batting_totals(batting):
+    """Sum every Game Notes stat column in one pass, treating missing columns as 0"""
+    present = [col for col in GAME_NOTE_TOTALS if col in batting.columns]
+    return batting[present].sum().reindex(GAME_NOTE_TOTALS, fill_value=0).astype(int)
+
+def _names_with(batting, col):
+    """Comma-separated names of players with a positive value in a stat column"""
+    return ', '.join(batting.loc[batting[col] > 0, 'name'].astype(str))
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _team_batting_box(batting_data):
+    """Build the batting table, Game Notes, total bases and LOB for one team"""
+    batting = pd.DataFrame(batting_data)
+
+    # Ensure required columns exist before processing
+    batting = batting.reindex(columns=batting.columns.union(list(REQUIRED_BATTING_COLUMNS), sort=False))
+
+    # Convert order to numeric, keeping NaN values
+    batting['order'] = pd.to_numeric(batting['order'], errors='coerce')
+
+    # Coerce stat columns once so every downstream sum is a compiled int32 reduction
+    stat_columns = [col for col in BATTING_STAT_COLUMNS if col in batting.columns]
+    batting[stat_columns] = batting[stat_columns].apply(pd.to_numeric, errors='coerce').fillna(0).astype('int32')
+
+    # Sort by batting order with substitutes right after their starters
+    batting = _order_with_subs(batting)
+
+    # Format player names with indentation for substitutes
+    batting['Player'] = _format_player_names(batting)
+
+    # Create final DataFrame for display
+    display_columns = ['Player', *(col for col in BATTING_COLUMNS_ORDER if col in batting.columns)]
+    batting_display = batting.reindex(columns=display_columns).rename(columns=BATTING_COLUMN_NAMES)
+
+    # Calculate game totals and notes in MLB standard format
+    totals = _batting_totals(batting)
+    total_bases = totals.reindex(TOTAL_BASE_WEIGHTS.index, fill_value=0).dot(TOTAL_BASE_WEIGHTS)
+    notes = [
+        f"{label} ({totals[col]}): {_names_with(batting, col)}"
+        for label, col in GAME_NOTE_LABELS if totals[col] > 0
+    ]
+    return batting_display, notes, int(total_bases), int(totals['lob'])
+
+def _render_team_batting(batting_data, label):
+    st.markdown(f"#### {label} Team Batting")
+    if not batting_data:
+        st.info(f"No {label.lower()} team batting data available")
+        return
+
+    batting_display, notes, total_bases, lob = _team_batting_box(batting_data)
+    st.dataframe(batting_display,
+               use_container_width=True,
+               hide_index=True)
+
+    st.markdown("---")
+    st.markdown("**Game Notes:**")
+    if notes:
+        st.markdown(" • " + "\n • ".join(notes))
+    st.markdown(f"**TB:** {total_bases} • **LOB:** {lob}")
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _pitching_table(pitching_data):
+    """Pitching box score rows with columns reordered for presentation"""
+    # Small table shown as-is, so skip building a DataFrame; st.dataframe takes the rows directly
+    present = set().union(*pitching_data)
+    columns = [col for col in PITCHING_COLUMNS_ORDER if col in present]
+    return [{col: row.get(col) for col in columns} for row in pitching_data]
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def _render_card_html(card_style, date_str, away_team, away_score, home_team, home_score, notes):
+    return f"""
+            <div style='{card_style}'>
+                <h4 style='margin-bottom:0.2em;'>📅 {date_str}</h4>
+                <div style='font-size:1.1em; margin-bottom:0.5em;'>
+                    <div style='font-weight:600; margin-bottom:0.2em;'>{away_team} <span style='color:#888;'>({away_score})</span></div>
+                    <div style='color:#666; margin-bottom:0.2em;'>@</div>
+                    <div style='font-weight:600;'>{home_team} <span style='color:#888;'>({home_score})</span></div>
+                </div>
+                {f'<div style="margin-bottom:0.5em; color:#bbb;">📝 {notes}</div>' if notes else ''}
+            </div>
+            """
+
+def _set_mygames_page(page_num):
+    # Runs before the click's rerun, so the new page renders in that same pass
+    st.session_state.mygames_page = page_num
+
 def my_games_page():
     st.header("My Attended Games")
-    games = st.session_state.data_manager.get_all_games()
+    games = _get_games()
     if not games:
         st.info("No games added yet. Go to 'Add Game' to start tracking your attended games.")
         return
 
-    # Detect Streamlit theme (dark/light)
+    # Detect Streamlit theme (dark/light) and rebuild the card style only when it changes
     theme = st.get_option("theme.base")
-    is_dark = theme == "dark"
-    card_bg = "#23272f" if is_dark else "#f8f9fa"
-    card_text = "#f8f9fa" if is_dark else "#23272f"
-    card_shadow = "0 2px 8px rgba(0,0,0,0.18)" if is_dark else "0 2px 8px rgba(0,0,0,0.04)"
+    if st.session_state.get('_theme') != theme or 'card_style' not in st.session_state:
+        is_dark = theme == "dark"
+        card_bg = "#23272f" if is_dark else "#f8f9fa"
+        card_text = "#f8f9fa" if is_dark else "#23272f"
+        card_shadow = "0 2px 8px rgba(0,0,0,0.18)" if is_dark else "0 2px 8px rgba(0,0,0,0.04)"
+        st.session_state._theme = theme
+        st.session_state.card_style = (
+            f"background: {card_bg}; color: {card_text}; border-radius: 12px; "
+            f"padding: 1em 1.2em; margin-bottom: 1.2em; box-shadow: {card_shadow};"
+        )
+
+    # Only render one page of cards per rerun
+    page_count = (len(games) + GAMES_PER_PAGE - 1) // GAMES_PER_PAGE
+    page_num = min(st.session_state.get('mygames_page', 0), page_count - 1)
+    st.session_state.mygames_page = page_num
+    start = page_num * GAMES_PER_PAGE
 
     cols = st.columns(3)
 
-    for idx, game in enumerate(games):
-        with cols[idx % 3]:
+    for offset, game in enumerate(games[start:start + GAMES_PER_PAGE]):
+        idx = start + offset
+        with cols[offset % 3]:
             home_team = game.get('home_team', 'N/A')
             away_team = game.get('away_team', 'N/A')
             home_score = game.get('home_score', 'N/A')
@@ -178,17 +400,10 @@ def my_games_page():
             date_str = game.get('date', 'N/A')
             notes = game.get('notes', '')
 
-            st.markdown(f"""
-            <div style='background: {card_bg}; color: {card_text}; border-radius: 12px; padding: 1em 1.2em; margin-bottom: 1.2em; box-shadow: {card_shadow};'>
-                <h4 style='margin-bottom:0.2em;'>📅 {date_str}</h4>
-                <div style='font-size:1.1em; margin-bottom:0.5em;'>
-                    <div style='font-weight:600; margin-bottom:0.2em;'>{away_team} <span style='color:#888;'>({away_score})</span></div>
-                    <div style='color:#666; margin-bottom:0.2em;'>@</div>
-                    <div style='font-weight:600;'>{home_team} <span style='color:#888;'>({home_score})</span></div>
-                </div>
-                {f'<div style="margin-bottom:0.5em; color:#bbb;">📝 {notes}</div>' if notes else ''}
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(
+                _render_card_html(st.session_state.card_style, date_str, away_team, away_score, home_team, home_score, notes),
+                unsafe_allow_html=True
+            )
             # Working remove button below the card
             remove_btn_label = f"Remove Game {idx+1} ({away_team} @ {home_team})"
             if st.button("🗑️ Remove Game", key=f"remove_game_{idx}"):
@@ -196,6 +411,17 @@ def my_games_page():
                     st.success("Game removed successfully!")
                     st.rerun()
 
+    if page_count > 1:
+        prev_col, info_col, next_col = st.columns([1, 2, 1])
+        with prev_col:
+            st.button("← Previous", disabled=page_num == 0, use_container_width=True,
+                      on_click=_set_mygames_page, args=(page_num - 1,))
+        with info_col:
+            st.caption(f"Page {page_num + 1} of {page_count} ({len(games)} games)")
+        with next_col:
+            st.button("Next →", disabled=page_num >= page_count - 1, use_container_width=True,
+                      on_click=_set_mygames_page, args=(page_num + 1,))
+
     # Optionally, keep the detailed info section if needed
     if st.checkbox("Show detailed game information"):
         selected_game_idx = st.selectbox(
@@ -219,298 +445,8 @@ def my_games_page():
                     tabs = st.tabs(["Batting", "Pitching", "Game Info"])
                     
                     with tabs[0]:  # Batting Stats
-                        # Display away team batting
-                            st.markdown("#### Away Team Batting")
-                            away_batting = None
-                            
-                            # Get away team batting stats
-                            away_batting_data = game.get('away_team_batting', [])
-                            
-                            if away_batting_data:
-                                # Create DataFrame and sort by batting order
-                                away_batting = pd.DataFrame(away_batting_data)
-                                
-                                # Ensure required columns exist before processing
-                                required_columns = ['name', 'order', 'sub', 'position']
-                                for col in required_columns:
-                                    if col not in away_batting.columns:
-                                        away_batting[col] = None
-                                
-                                # Format player names with indentation for substitutes
-                                def format_player_name(row):
-                                    try:
-                                        name = str(row['name']) if pd.notnull(row['name']) else 'Unknown'
-                                        position = str(row['position']) if pd.notnull(row['position']) and row['position'] != '' else ''
-                                        
-                                        # Determine if this is a substitute
-                                        is_sub = pd.notnull(row.get('sub')) and bool(row.get('sub'))
-                                        
-                                        # Get batting order
-                                        order_num = row.get('order')
-                                        has_order = pd.notnull(order_num) and order_num is not None
-                                        
-                                        # Build the display string
-                                        prefix = "    " if is_sub else ""  # Four spaces for indentation
-                                        order_str = f"{int(order_num)}. " if not is_sub and has_order else ""
-                                        pos_str = f" ({position})" if position else ""
-                                        
-                                        return f"{prefix}{order_str}{name}{pos_str}"
-                                    except Exception as e:
-                                        st.write(f"Debug - Error formatting player: {e}")
-                                        st.write("Debug - Row data:", row.to_dict())
-                                        return f"{row.get('name', 'Unknown')}"
-                                
-                                # Ensure required columns exist
-                                if 'order' not in away_batting.columns:
-                                    away_batting['order'] = None
-                                if 'sub' not in away_batting.columns:
-                                    away_batting['sub'] = False
-                                if 'position' not in away_batting.columns:
-                                    away_batting['position'] = ''
-                                
-                                # Convert order to numeric, keeping NaN values
-                                away_batting['order'] = pd.to_numeric(away_batting['order'], errors='coerce')
-                                
-                                # Sort by batting order first
-                                away_batting = away_batting.sort_values(
-                                    by=['order'],
-                                    na_position='last'
-                                )
-                                
-                                # Create ordered display DataFrame
-                                rows = []
-                                sub_groups = {}  # Dictionary to hold substitutes for each batting order
-                                other_subs = []  # For substitutes without a batting order
-                                
-                                # First pass: identify starters and build a map of who replaced whom
-                                player_subs = {}  # Dictionary to map players to their substitutes
-                                starter_by_position = {}  # Keep track of starters by position
-                                
-                                for _, row in away_batting.iterrows():
-                                    if not row['sub']:
-                                        # It's a starter
-                                        rows.append(row)
-                                        if pd.notnull(row['position']) and row['position']:
-                                            starter_by_position[row['position']] = row['name']
-                                    else:
-                                        # It's a substitute, find who they replaced
-                                        if pd.notnull(row['position']) and row['position'] in starter_by_position:
-                                            # Find the starter they replaced
-                                            starter_name = starter_by_position[row['position']]
-                                            if starter_name not in player_subs:
-                                                player_subs[starter_name] = []
-                                            player_subs[starter_name].append(row)
-                                        else:
-                                            other_subs.append(row)
-                                
-                                # Second pass: create the final order with subs right after their starters
-                                final_rows = []
-                                for row in rows:
-                                    final_rows.append(row)
-                                    # Add any substitutes for this player right after them
-                                    if row['name'] in player_subs:
-                                        final_rows.extend(player_subs[row['name']])
-                                
-                                # Add any unmatched substitutes at the end
-                                final_rows.extend(other_subs)
-                                
-                                # Create new DataFrame with correct order
-                                away_batting = pd.DataFrame(final_rows)
-                                
-                                away_batting['Player'] = away_batting.apply(format_player_name, axis=1)
-                                
-                                # Reorder columns for better presentation
-                                columns_order = ['Player', 'at_bats', 'hits', 'runs', 'rbis', 
-                                               'doubles', 'triples', 'home_runs', 'walks', 
-                                               'strikeouts', 'stolen_bases', 'caught_stealing']
-                                
-                                # Create final DataFrame for display
-                                display_columns = ['Player'] + [col for col in columns_order if col in away_batting.columns and col != 'Player']
-                                away_batting_display = away_batting[display_columns].copy()
-                                
-                                # Rename columns for better presentation
-                                column_names = {
-                                    'at_bats': 'AB',
-                                    'hits': 'H',
-                                    'runs': 'R',
-                                    'rbis': 'RBI',
-                                    'doubles': '2B',
-                                    'triples': '3B',
-                                    'home_runs': 'HR',
-                                    'walks': 'BB',
-                                    'strikeouts': 'SO',
-                                    'stolen_bases': 'SB',
-                                    'caught_stealing': 'CS'
-                                }
-                                away_batting_display.rename(columns=column_names, inplace=True)
-                                
-                                st.dataframe(away_batting_display, 
-                                           use_container_width=True,
-                                           hide_index=True)
-                                
-                                # Calculate and display game totals and notes
-                                doubles = away_batting['doubles'].sum() if 'doubles' in away_batting.columns else 0
-                                triples = away_batting['triples'].sum() if 'triples' in away_batting.columns else 0
-                                homers = away_batting['home_runs'].sum() if 'home_runs' in away_batting.columns else 0
-                                stolen = away_batting['stolen_bases'].sum() if 'stolen_bases' in away_batting.columns else 0
-                                caught = away_batting['caught_stealing'].sum() if 'caught_stealing' in away_batting.columns else 0
-                                gidp = away_batting['gidp'].sum() if 'gidp' in away_batting.columns else 0
-                                errors = away_batting['errors'].sum() if 'errors' in away_batting.columns else 0
-                                lob = away_batting['lob'].sum() if 'lob' in away_batting.columns else 0
-                                
-                                # Calculate total bases
-                                singles = away_batting['hits'].sum() - (doubles + triples + homers) if 'hits' in away_batting.columns else 0
-                                total_bases = singles + (2 * doubles) + (3 * triples) + (4 * homers)
-                                
-                                # Display game notes in MLB standard format
-                                notes = []
-                                if doubles > 0:
-                                    notes.append(f"2B ({doubles}): {', '.join([row['name'] for _, row in away_batting.iterrows() if row.get('doubles', 0) > 0])}")
-                                if triples > 0:
-                                    notes.append(f"3B ({triples}): {', '.join([row['name'] for _, row in away_batting.iterrows() if row.get('triples', 0) > 0])}")
-                                if homers > 0:
-                                    notes.append(f"HR ({homers}): {', '.join([row['name'] for _, row in away_batting.iterrows() if row.get('home_runs', 0) > 0])}")
-                                if stolen > 0:
-                                    notes.append(f"SB ({stolen}): {', '.join([row['name'] for _, row in away_batting.iterrows() if row.get('stolen_bases', 0) > 0])}")
-                                if caught > 0:
-                                    notes.append(f"CS ({caught}): {', '.join([row['name'] for _, row in away_batting.iterrows() if row.get('caught_stealing', 0) > 0])}")
-                                if gidp > 0:
-                                    notes.append(f"GIDP ({gidp}): {', '.join([row['name'] for _, row in away_batting.iterrows() if row.get('gidp', 0) > 0])}")
-                                if errors > 0:
-                                    notes.append(f"E ({errors}): {', '.join([row['name'] for _, row in away_batting.iterrows() if row.get('errors', 0) > 0])}")
-                                
-                                st.markdown("---")
-                                st.markdown("**Game Notes:**")
-                                if notes:
-                                    st.markdown(" • " + "\n • ".join(notes))
-                                st.markdown(f"**TB:** {total_bases} • **LOB:** {lob}")
-                            else:
-                                st.info("No away team batting data available")
-                            
-                            # Display home team batting
-                            st.markdown("#### Home Team Batting")
-                            home_batting_data = game.get('home_team_batting', [])
-                            if home_batting_data:
-                                # Create DataFrame and sort by batting order
-                                home_batting = pd.DataFrame(home_batting_data)
-                                
-                                # Ensure required columns exist before processing
-                                required_columns = ['name', 'order', 'sub', 'position']
-                                for col in required_columns:
-                                    if col not in home_batting.columns:
-                                        home_batting[col] = None
-                                
-                                # Add order column if not present
-                                home_batting['order'] = pd.to_numeric(home_batting['order'], errors='coerce')
-                                home_batting['sub'] = home_batting['sub'].fillna(False)
-                                
-                                # Sort by batting order first
-                                home_batting = home_batting.sort_values(
-                                    by=['order'],
-                                    na_position='last'
-                                )
-                                
-                                # Create ordered display DataFrame
-                                rows = []
-                                sub_groups = {}  # Dictionary to hold substitutes for each batting order
-                                other_subs = []  # For substitutes without a batting order
-                                
-                                # First pass: identify starters and build a map of who replaced whom
-                                player_subs = {}  # Dictionary to map players to their substitutes
-                                starter_by_position = {}  # Keep track of starters by position
-                                
-                                for _, row in home_batting.iterrows():
-                                    if not row['sub']:
-                                        # It's a starter
-                                        rows.append(row)
-                                        if pd.notnull(row['position']) and row['position']:
-                                            starter_by_position[row['position']] = row['name']
-                                    else:
-                                        # It's a substitute, find who they replaced
-                                        if pd.notnull(row['position']) and row['position'] in starter_by_position:
-                                            # Find the starter they replaced
-                                            starter_name = starter_by_position[row['position']]
-                                            if starter_name not in player_subs:
-                                                player_subs[starter_name] = []
-                                            player_subs[starter_name].append(row)
-                                        else:
-                                            other_subs.append(row)
-                                
-                                # Second pass: create the final order with subs right after their starters
-                                final_rows = []
-                                for row in rows:
-                                    final_rows.append(row)
-                                    # Add any substitutes for this player right after them
-                                    if row['name'] in player_subs:
-                                        final_rows.extend(player_subs[row['name']])
-                                
-                                # Add any unmatched substitutes at the end
-                                final_rows.extend(other_subs)
-                                
-                                # Create new DataFrame with correct order
-                                home_batting = pd.DataFrame(final_rows)
-                                
-                                # Format player names with indentation for substitutes
-                                def format_player_name(row):
-                                    try:
-                                        prefix = "    " if row.get('sub', False) else ""
-                                        order = f"{int(row['order'])}. " if 'order' in row and pd.notnull(row['order']) else "   "
-                                        pos = f" ({row['position']})" if 'position' in row and row['position'] else ""
-                                        return f"{prefix}{order}{row['name']}{pos}"
-                                    except:
-                                        return f"{row.get('name', 'Unknown')}"
-                                
-                                home_batting['Player'] = home_batting.apply(format_player_name, axis=1)
-                                
-                                # Create final DataFrame for display
-                                display_columns = ['Player'] + [col for col in columns_order if col in home_batting.columns and col != 'Player']
-                                home_batting_display = home_batting[display_columns].copy()
-                                
-                                # Use same column names as away team
-                                home_batting_display.rename(columns=column_names, inplace=True)
-                                
-                                st.dataframe(home_batting_display, 
-                                           use_container_width=True,
-                                           hide_index=True)
-                                
-                                # Calculate and display game totals and notes
-                                doubles = home_batting['doubles'].sum() if 'doubles' in home_batting.columns else 0
-                                triples = home_batting['triples'].sum() if 'triples' in home_batting.columns else 0
-                                homers = home_batting['home_runs'].sum() if 'home_runs' in home_batting.columns else 0
-                                stolen = home_batting['stolen_bases'].sum() if 'stolen_bases' in home_batting.columns else 0
-                                caught = home_batting['caught_stealing'].sum() if 'caught_stealing' in home_batting.columns else 0
-                                gidp = home_batting['gidp'].sum() if 'gidp' in home_batting.columns else 0
-                                errors = home_batting['errors'].sum() if 'errors' in home_batting.columns else 0
-                                lob = home_batting['lob'].sum() if 'lob' in home_batting.columns else 0
-                                
-                                # Calculate total bases
-                                singles = home_batting['hits'].sum() - (doubles + triples + homers) if 'hits' in home_batting.columns else 0
-                                total_bases = singles + (2 * doubles) + (3 * triples) + (4 * homers)
-                                
-                                # Display game notes in MLB standard format
-                                notes = []
-                                if doubles > 0:
-                                    notes.append(f"2B ({doubles}): {', '.join([row['name'] for _, row in home_batting.iterrows() if row.get('doubles', 0) > 0])}")
-                                if triples > 0:
-                                    notes.append(f"3B ({triples}): {', '.join([row['name'] for _, row in home_batting.iterrows() if row.get('triples', 0) > 0])}")
-                                if homers > 0:
-                                    notes.append(f"HR ({homers}): {', '.join([row['name'] for _, row in home_batting.iterrows() if row.get('home_runs', 0) > 0])}")
-                                if stolen > 0:
-                                    notes.append(f"SB ({stolen}): {', '.join([row['name'] for _, row in home_batting.iterrows() if row.get('stolen_bases', 0) > 0])}")
-                                if caught > 0:
-                                    notes.append(f"CS ({caught}): {', '.join([row['name'] for _, row in home_batting.iterrows() if row.get('caught_stealing', 0) > 0])}")
-                                if gidp > 0:
-                                    notes.append(f"GIDP ({gidp}): {', '.join([row['name'] for _, row in home_batting.iterrows() if row.get('gidp', 0) > 0])}")
-                                if errors > 0:
-                                    notes.append(f"E ({errors}): {', '.join([row['name'] for _, row in home_batting.iterrows() if row.get('errors', 0) > 0])}")
-                                
-                                st.markdown("---")
-                                st.markdown("**Game Notes:**")
-                                if notes:
-                                    st.markdown(" • " + "\n • ".join(notes))
-                                st.markdown(f"**TB:** {total_bases} • **LOB:** {lob}")
-                            else:
-                                st.info("No home team batting data available")
+                        _render_team_batting(game.get('away_team_batting', []), "Away")
+                        _render_team_batting(game.get('home_team_batting', []), "Home")
                         
                     with tabs[1]:  # Pitching Stats
                         # Display away team pitching
@@ -520,11 +456,7 @@ def my_games_page():
                         # Get away team pitching stats
                         away_pitching_data = game.get('away_team_pitching', [])
                         if away_pitching_data:
-                            away_pitching = pd.DataFrame(away_pitching_data)
-                            # Reorder columns for better presentation
-                            columns_order = ['name', 'innings_pitched', 'hits_allowed', 'runs_allowed', 
-                                           'earned_runs', 'walks', 'strikeouts', 'home_runs_allowed']
-                            away_pitching = away_pitching.reindex(columns=[col for col in columns_order if col in away_pitching.columns])
+                            away_pitching = _pitching_table(away_pitching_data)
                             st.dataframe(away_pitching, use_container_width=True)
                         else:
                             st.info("No away team pitching data available")
@@ -534,9 +466,7 @@ def my_games_page():
                         home_pitching = None                        # Get home team pitching stats
                         home_pitching_data = game.get('home_team_pitching', [])
                         if home_pitching_data:
-                            home_pitching = pd.DataFrame(home_pitching_data)
-                            # Reorder columns for better presentation
-                            home_pitching = home_pitching.reindex(columns=[col for col in columns_order if col in home_pitching.columns])
+                            home_pitching = _pitching_table(home_pitching_data)
                             st.dataframe(home_pitching, use_container_width=True)
                         else:
                             st.info("No home team pitching data available")
@@ -567,17 +497,32 @@ def my_games_page():
                 else:
                     st.info("No box score available for this game.")
 
+@st.fragment
+def _min_games_filter(df, label, single_game_msg, key=None):
+    """Slider and table for a stats frame; runs as a fragment so moving the slider only reruns this block"""
+    max_games = int(df['games'].max()) if 'games' in df.columns and len(df) > 0 else 1
+    if max_games > 1:
+        min_games = st.slider(label, 1, max_games, 1, key=key)
+    else:
+        min_games = 1
+        st.info(single_game_msg)
+    filtered = df[df['games'] >= min_games] if 'games' in df.columns else df
+    
+    st.dataframe(filtered, use_container_width=True)
+
 def player_stats_page():
     st.header("Player Statistics")
     
-    games = st.session_state.data_manager.get_all_games()
+    games = _get_games()
     
     if not games:
         st.info("No games added yet. Add some games to see player statistics.")
         return
     
     # Calculate aggregated stats
-    batting_stats, pitching_stats = st.session_state.stats_calculator.calculate_aggregate_stats(games)
+    sig = _games_signature()
+    batting_stats, pitching_stats = _aggregate_stats(sig, games)
+    batting_df, pitching_df = _stats_frames(sig, games)
     
     tab1, tab2 = st.tabs(["Batting Stats", "Pitching Stats"])
     
@@ -585,9 +530,6 @@ def player_stats_page():
         if batting_stats:
             st.subheader("Batting Statistics")
             
-            # Convert to DataFrame for better display
-            batting_df = pd.DataFrame(batting_stats)
-            
             # Sort by games played
             if 'games' in batting_df.columns:
                 batting_df = batting_df.sort_values('games', ascending=False)
@@ -595,30 +537,22 @@ def player_stats_page():
             # Display top performers
             col1, col2 = st.columns(2)
             
+            # One reduction over all the summed columns
+            totals = batting_df[batting_df.columns.intersection(['at_bats', 'hits', 'home_runs'])].sum(numeric_only=True)
+            
             with col1:
                 st.metric("Total Players Seen", len(batting_df))
-                if 'at_bats' in batting_df.columns:
-                    total_at_bats = batting_df['at_bats'].sum()
-                    st.metric("Total At Bats", total_at_bats)
+                if 'at_bats' in totals:
+                    st.metric("Total At Bats", int(totals['at_bats']))
             
             with col2:
-                if 'hits' in batting_df.columns:
-                    total_hits = batting_df['hits'].sum()
-                    st.metric("Total Hits", total_hits)
-                if 'home_runs' in batting_df.columns:
-                    total_hrs = batting_df['home_runs'].sum()
-                    st.metric("Total Home Runs", total_hrs)
+                if 'hits' in totals:
+                    st.metric("Total Hits", int(totals['hits']))
+                if 'home_runs' in totals:
+                    st.metric("Total Home Runs", int(totals['home_runs']))
             
-            # Filter options
-            max_games = int(batting_df['games'].max()) if 'games' in batting_df.columns and len(batting_df) > 0 else 1
-            if max_games > 1:
-                min_games = st.slider("Minimum games played", 1, max_games, 1)
-            else:
-                min_games = 1
-                st.info("All players have played 1 game or less. Showing all available data.")
-            filtered_batting = batting_df[batting_df['games'] >= min_games] if 'games' in batting_df.columns else batting_df
-            
-            st.dataframe(filtered_batting, use_container_width=True)
+            _min_games_filter(batting_df, "Minimum games played",
+                              "All players have played 1 game or less. Showing all available data.")
         else:
             st.info("No batting statistics available.")
     
@@ -626,9 +560,6 @@ def player_stats_page():
         if pitching_stats:
             st.subheader("Pitching Statistics")
             
-            # Convert to DataFrame for better display
-            pitching_df = pd.DataFrame(pitching_stats)
-            
             # Sort by games played
             if 'games' in pitching_df.columns:
                 pitching_df = pitching_df.sort_values('games', ascending=False)
@@ -636,129 +567,152 @@ def player_stats_page():
             # Display summary stats
             col1, col2 = st.columns(2)
             
+            # One reduction over all the summed columns
+            totals = pitching_df[pitching_df.columns.intersection(['innings_pitched', 'strikeouts', 'earned_runs'])].sum(numeric_only=True)
+            
             with col1:
                 st.metric("Total Pitchers Seen", len(pitching_df))
-                if 'innings_pitched' in pitching_df.columns:
-                    total_ip = pitching_df['innings_pitched'].sum()
-                    st.metric("Total Innings Pitched", f"{total_ip:.1f}")
+                if 'innings_pitched' in totals:
+                    st.metric("Total Innings Pitched", f"{totals['innings_pitched']:.1f}")
             
             with col2:
-                if 'strikeouts' in pitching_df.columns:
-                    total_ks = pitching_df['strikeouts'].sum()
-                    st.metric("Total Strikeouts", total_ks)
-                if 'earned_runs' in pitching_df.columns:
-                    total_er = pitching_df['earned_runs'].sum()
-                    st.metric("Total Earned Runs", total_er)
+                if 'strikeouts' in totals:
+                    st.metric("Total Strikeouts", int(totals['strikeouts']))
+                if 'earned_runs' in totals:
+                    st.metric("Total Earned Runs", int(totals['earned_runs']))
             
-            # Filter options
-            max_games = int(pitching_df['games'].max()) if 'games' in pitching_df.columns and len(pitching_df) > 0 else 1
-            if max_games > 1:
-                min_games = st.slider("Minimum games pitched", 1, max_games, 1, key="pitching_filter")
-            else:
-                min_games = 1
-                st.info("All pitchers have pitched 1 game or less. Showing all available data.")
-            filtered_pitching = pitching_df[pitching_df['games'] >= min_games] if 'games' in pitching_df.columns else pitching_df
-            
-            st.dataframe(filtered_pitching, use_container_width=True)
+            _min_games_filter(pitching_df, "Minimum games pitched",
+                              "All pitchers have pitched 1 game or less. Showing all available data.",
+                              key="pitching_filter")
         else:
             st.info("No pitching statistics available.")
 
+TEAM_RECORD_COLUMNS = ["Games", "Wins", "Losses", "Ties", "Runs For", "Runs Against"]
+
+# Below this many scored games the pandas groupby beats numba's import and JIT compile
+NUMBA_MIN_GAMES = 100_000
+
+@st.cache_resource(show_spinner=False)
+def _tally_records_kernel():
+    """Compiled team-record tally, or None when numba is not installed"""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit
+    def _tally_records(home, away, home_score, away_score, out):
+        # out[team] = Games, Wins, Losses, Ties, Runs For, Runs Against
+        for i in range(home.size):
+            h = home[i]
+            a = away[i]
+            hs = home_score[i]
+            aws = away_score[i]
+            out[h, 0] += 1
+            out[a, 0] += 1
+            out[h, 4] += hs
+            out[h, 5] += aws
+            out[a, 4] += aws
+            out[a, 5] += hs
+            if hs > aws:
+                out[h, 1] += 1
+                out[a, 2] += 1
+            elif hs < aws:
+                out[a, 1] += 1
+                out[h, 2] += 1
+            else:
+                out[h, 3] += 1
+                out[a, 3] += 1
+
+    return _tally_records
+
+def _team_records(games_df):
+    """Games, W/L/T and runs for/against per team, skipping games without scores"""
+    scores = games_df[['home_team', 'away_team', 'home_score', 'away_score']].dropna()
+    home_score = scores['home_score'].astype(int)
+    away_score = scores['away_score'].astype(int)
+
+    tally = _tally_records_kernel() if len(scores) >= NUMBA_MIN_GAMES else None
+    if tally is not None:
+        # Single compiled pass over the categorical team codes
+        teams = scores['home_team'].cat.categories
+        out = np.zeros((len(teams), len(TEAM_RECORD_COLUMNS)), dtype=np.int64)
+        tally(scores['home_team'].cat.codes.to_numpy(), scores['away_team'].cat.codes.to_numpy(),
+                       home_score.to_numpy(np.int64), away_score.to_numpy(np.int64), out)
+        records = pd.DataFrame(out, index=teams, columns=TEAM_RECORD_COLUMNS)
+        # Teams whose only games had missing scores
+        records = records[records["Games"] > 0]
+    else:
+        # One row per team per game, from that team's point of view
+        sides = pd.concat([
+            pd.DataFrame({'team': scores['home_team'], 'rf': home_score, 'ra': away_score}),
+            pd.DataFrame({'team': scores['away_team'], 'rf': away_score, 'ra': home_score}),
+        ], ignore_index=True)
+        sides['win'] = sides['rf'] > sides['ra']
+        sides['loss'] = sides['rf'] < sides['ra']
+        sides['tie'] = sides['rf'] == sides['ra']
+
+        records = sides.groupby('team', sort=False, observed=True).agg(**{
+            "Games": ('rf', 'size'),
+            "Wins": ('win', 'sum'),
+            "Losses": ('loss', 'sum'),
+            "Ties": ('tie', 'sum'),
+            "Runs For": ('rf', 'sum'),
+            "Runs Against": ('ra', 'sum'),
+        })
+    records["Win%"] = records["Wins"] / records["Games"]
+    return records.rename_axis("Team").reset_index()
+
+@st.cache_data(max_entries=VERSIONED_CACHE_ENTRIES, show_spinner=False)
+def _top_bar(sig, _top, x, title):
+    """Horizontal leaderboard bar chart, rebuilt only when the games change"""
+    # Plotly is slow to import and only the dashboard charts need it
+    import plotly.express as px
+    return px.bar(_top, x=x, y='player_name', orientation='h', title=title)
+
 def dashboard_page():
     st.header("Statistics Dashboard")
     
-    games = st.session_state.data_manager.get_all_games()
+    games = _get_games()
     
     if not games:
         st.info("No games added yet. Add some games to see visualizations.")
         return
     
     # Calculate stats for visualization
-    batting_stats, pitching_stats = st.session_state.stats_calculator.calculate_aggregate_stats(games)
+    sig = _games_signature()
+    batting_stats, pitching_stats = _aggregate_stats(sig, games)
     
 
     # Games summary table (by month)
     st.subheader("Games Attended by Month")
-    games_by_month = {}
-    for g in games:
-        d = g.get('date', 'Unknown')
-        try:
-            dt = datetime.strptime(d, '%Y-%m-%d')
-            month_str = dt.strftime('%Y-%m')
-        except Exception:
-            month_str = 'Unknown'
-        games_by_month[month_str] = games_by_month.get(month_str, 0) + 1
-    games_by_month_list = [{"Month": k, "Games Attended": v} for k, v in sorted(games_by_month.items())]
+    games_df = _games_frame(sig, games)
+    dates = pd.to_datetime(games_df['date'], format='%Y-%m-%d', errors='coerce')
+    games_by_month = dates.dt.strftime('%Y-%m').fillna('Unknown').value_counts().sort_index()
+    games_by_month_list = games_by_month.rename_axis("Month").reset_index(name="Games Attended")
     st.table(games_by_month_list)
 
     # Top teams by games attended (table)
     st.subheader("Top Teams by Games Attended")
-    team_counts = {}
-    for g in games:
-        home = g.get('home_team')
-        away = g.get('away_team')
-        for t in (home, away):
-            if t:
-                team_counts[t] = team_counts.get(t, 0) + 1
-    teams_list = [{"Team": t, "Games Attended": c} for t, c in sorted(team_counts.items(), key=lambda x: -x[1])]
-    st.table(teams_list[:20])
+    teams = pd.concat([games_df['home_team'], games_df['away_team']])
+    team_counts = teams[teams.notna() & (teams != '')].value_counts()
+    team_counts = team_counts[team_counts > 0]
+    teams_list = team_counts.head(20).rename_axis("Team").reset_index(name="Games Attended")
+    st.table(teams_list)
 
     # Aggregated Team-by-Team Record
     st.subheader("Aggregated Team-by-Team Record")
-    records = {}
-    for g in games:
-        home = g.get('home_team')
-        away = g.get('away_team')
-        hs = g.get('home_score')
-        ascore = g.get('away_score')
-        # skip if scores missing
-        if home is None or away is None or hs is None or ascore is None:
-            continue
-        # initialize
-        for t in (home, away):
-            if t not in records:
-                records[t] = {"Games":0, "Wins":0, "Losses":0, "Ties":0, "Runs For":0, "Runs Against":0}
-        # update games and runs
-        records[home]["Games"] += 1
-        records[away]["Games"] += 1
-        records[home]["Runs For"] += int(hs)
-        records[home]["Runs Against"] += int(ascore)
-        records[away]["Runs For"] += int(ascore)
-        records[away]["Runs Against"] += int(hs)
-        # determine result
-        if int(hs) > int(ascore):
-            records[home]["Wins"] += 1
-            records[away]["Losses"] += 1
-        elif int(hs) < int(ascore):
-            records[away]["Wins"] += 1
-            records[home]["Losses"] += 1
-        else:
-            records[home]["Ties"] += 1
-            records[away]["Ties"] += 1
-
-    # convert to list and compute win%
-    records_list = []
-    for t, r in records.items():
-        win_pct = (r["Wins"] / r["Games"]) if r["Games"] > 0 else 0
-        records_list.append({
-            "Team": t,
-            "Games": r["Games"],
-            "Wins": r["Wins"],
-            "Losses": r["Losses"],
-            "Ties": r["Ties"],
-            "Runs For": r["Runs For"],
-            "Runs Against": r["Runs Against"],
-            "Win%": f"{win_pct:.3f}"
-        })
-    # show sorted by Win%
-    records_list_sorted = sorted(records_list, key=lambda x: (-float(x["Win%"]), -x["Games"]))
-    st.dataframe(records_list_sorted, use_container_width=True)
+    records = _team_records(games_df)
+    # show sorted by Win%, formatting it only for display
+    records = records.sort_values(["Win%", "Games"], ascending=[False, False])
+    st.dataframe(records.style.format({"Win%": "{:.3f}"}), use_container_width=True, hide_index=True)
 
     # Replace player performance charts with tables of top performances (fall back to existing stats)
     # Player performance charts
     if batting_stats:
         st.subheader("Top Batting Performances")
         
-        batting_df = pd.DataFrame(batting_stats)
+        batting_df, _ = _stats_frames(sig, games)
         
         if len(batting_df) > 0 and 'games' in batting_df.columns:
             # Filter for players with at least 3 games
@@ -769,23 +723,27 @@ def dashboard_page():
                 with col1:
                     if 'batting_average' in eligible_players.columns:
                         top_avg = eligible_players.nlargest(10, 'batting_average')
-                        fig_avg = px.bar(top_avg, x='batting_average', y='player_name',
-                                        orientation='h', title='Top 10 Batting Averages (Min 3 Games)')
+                        fig_avg = _top_bar(sig, top_avg, 'batting_average', 'Top 10 Batting Averages (Min 3 Games)')
                         st.plotly_chart(fig_avg, use_container_width=True)
                 
                 with col2:
                     if 'home_runs' in eligible_players.columns:
                         top_hr = eligible_players.nlargest(10, 'home_runs')
-                        fig_hr = px.bar(top_hr, x='home_runs', y='player_name',
-                                       orientation='h', title='Top 10 Home Run Totals (Min 3 Games)')
+                        fig_hr = _top_bar(sig, top_hr, 'home_runs', 'Top 10 Home Run Totals (Min 3 Games)')
                         st.plotly_chart(fig_hr, use_container_width=True)
             else:
                 st.info("No players with at least 3 games for batting average leaderboard.")
 
+def _csv_bytes(df):
+    """Encode a frame as UTF-8 CSV straight into a bytes buffer"""
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8', lineterminator='\n')
+    return buf.getvalue()
+
 def export_data_page():
     st.header("Export Player Statistics")
 
-    games = st.session_state.data_manager.get_all_games()
+    games = _get_games()
 
     if not games:
         st.info("No data to export. Add some games first.")
@@ -794,7 +752,8 @@ def export_data_page():
     st.write("Export aggregated player statistics from all your attended games.")
 
     # Calculate aggregated stats
-    batting_stats, pitching_stats = st.session_state.stats_calculator.calculate_aggregate_stats(games)
+    sig = _games_signature()
+    batting_stats, pitching_stats = _aggregate_stats(sig, games)
 
     export_format = st.selectbox(
         "Select export format",
@@ -805,20 +764,18 @@ def export_data_page():
         try:
             if export_format == "JSON":
                 # Export aggregated player stats as JSON
-                export_data = {
-                    "batting_stats": batting_stats,
-                    "pitching_stats": pitching_stats,
-                    "export_date": datetime.now().isoformat(),
-                    "total_games": len(games),
-                    "total_batters": len(batting_stats),
-                    "total_pitchers": len(pitching_stats)
-                }
-
-                json_str = json.dumps(export_data, indent=2, default=str)
+                json_bytes = get_stats_calculator().to_json_bytes(
+                    batting_stats,
+                    pitching_stats,
+                    export_date=datetime.now().isoformat(),
+                    total_games=len(games),
+                    total_batters=len(batting_stats),
+                    total_pitchers=len(pitching_stats)
+                )
 
                 st.download_button(
                     label="Download JSON",
-                    data=json_str,
+                    data=json_bytes,
                     file_name=f"player_stats_{datetime.now().strftime('%Y%m%d')}.json",
                     mime="application/json"
                 )
@@ -826,8 +783,8 @@ def export_data_page():
             elif export_format == "CSV":
                 # Export batting stats as CSV
                 if batting_stats:
-                    batting_df = pd.DataFrame(batting_stats)
-                    batting_csv = batting_df.to_csv(index=False)
+                    batting_df, _ = _stats_frames(sig, games)
+                    batting_csv = _csv_bytes(batting_df)
 
                     st.download_button(
                         label="Download Batting Stats CSV",
@@ -839,8 +796,8 @@ def export_data_page():
 
                 # Export pitching stats as CSV
                 if pitching_stats:
-                    pitching_df = pd.DataFrame(pitching_stats)
-                    pitching_csv = pitching_df.to_csv(index=False)
+                    _, pitching_df = _stats_frames(sig, games)
+                    pitching_csv = _csv_bytes(pitching_df)
 
                     st.download_button(
                         label="Download Pitching Stats CSV",
@@ -1,12 +1,29 @@
 import streamlit as st
-import streamlit_authenticator as stauth
 import yaml
+import os
 from typing import Optional, Tuple
 
+# libyaml's C loader/dumper are much faster than the pure-Python ones when available
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+@st.cache_data(show_spinner=False)
+def _read_config(config_file: str, mtime: float) -> dict:
+    """Parse the YAML config, re-reading only when the file's mtime changes"""
+    with open(config_file, 'r') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
 class AuthManager:
     def __init__(self, config_file: str = "config.yaml"):
         self.config_file = config_file
         self.config = self._load_config()
+        # Normalize missing or empty (null) sections so register_user can append to them
+        preauthorized = self.config.get('preauthorized') or {}
+        preauthorized['emails'] = preauthorized.get('emails') or []
+        self.config['preauthorized'] = preauthorized
+        self._preauthorized = set(preauthorized['emails'])
+        # Imported here rather than at module load to keep app startup light
+        import streamlit_authenticator as stauth
         self.authenticator = stauth.Authenticate(
             self.config['credentials'],
             self.config['cookie']['name'],
@@ -15,12 +32,11 @@ class AuthManager:
         )
 
     def _load_config(self) -> dict:
-        with open(self.config_file, 'r') as file:
-            return yaml.safe_load(file)
+        return _read_config(self.config_file, os.path.getmtime(self.config_file))
 
     def _save_config(self):
         with open(self.config_file, 'w') as file:
-            yaml.dump(self.config, file, default_flow_style=False)
+            yaml.dump(self.config, file, Dumper=_YamlDumper, default_flow_style=False)
 
     def login(self) -> Tuple[bool, Optional[str]]:
         """Display login form and return (success, username)"""
@@ -41,6 +57,7 @@ class AuthManager:
             return False  # User already exists
 
         # Hash the password
+        import streamlit_authenticator as stauth
         hashed_password = stauth.Hasher.hash(password)
 
         # Add user to config
@@ -51,8 +68,9 @@ class AuthManager:
         }
 
         # Add to preauthorized if needed
-        if email not in self.config.get('preauthorized', {}).get('emails', []):
-            self.config.setdefault('preauthorized', {}).setdefault('emails', []).append(email)
+        if email not in self._preauthorized:
+            self._preauthorized.add(email)
+            self.config['preauthorized']['emails'].append(email)
 
         self._save_config()
         return True
@@ -1,32 +1,115 @@
-import json
 import os
-from typing import List, Dict, Any, Optional
+from itertools import count
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+import orjson
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=str, option=option)
+
+# Process-wide so a version number is never reused by another DataManager,
+# which lets callers use (user_id, version) as a shared cache key
+_versions = count()
 
 class DataManager:
     def __init__(self, data_file: str = "baseball_data.json", user_id: str = None):
         self.user_id = user_id
         self.data_file = f"baseball_data_{user_id}.json" if user_id else data_file
+        # Games are kept in an append-only JSON Lines log next to the metadata file
+        self.games_file = f"{os.path.splitext(self.data_file)[0]}.jsonl"
+        # Set when the stored files couldn't be read cleanly; blocks rewrites that would drop their games
+        self._load_failed = False
         self.data = self._load_data()
+        # Bumped on every mutation so callers can cheaply tell when the games changed
+        self.version = next(_versions)
+        self._rebuild_indexes()
+    
+    @staticmethod
+    def _game_key(game: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+        """Identity of a game used for duplicate detection"""
+        return (game.get('date'), game.get('home_team_id'), game.get('away_team_id'))
+    
+    def _rebuild_indexes(self):
+        """Rebuild the duplicate-detection set from the games list"""
+        self._game_ids = {self._game_key(game) for game in self.data.get("games", [])}
+    
+    def _index_game(self, game: Dict[str, Any]):
+        """Add a newly appended game to the duplicate-detection set"""
+        self._game_ids.add(self._game_key(game))
     
     def _load_data(self) -> Dict[str, Any]:
-        """Load data from JSON file or create empty structure"""
+        """Load metadata from the JSON file and games from the JSONL log, or create empty structure"""
         try:
+            data = {"games": [], "created_at": datetime.now().isoformat()}
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                return {"games": [], "created_at": datetime.now().isoformat()}
+                with open(self.data_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            # Files written before the games log existed keep their games inline
+            if os.path.exists(self.games_file):
+                data["games"] = self._read_games_log()
+            data.setdefault("games", [])
+            return data
         except Exception as e:
             print(f"Error loading data: {e}")
+            self._load_failed = True
             return {"games": [], "created_at": datetime.now().isoformat()}
     
+    def _read_games_log(self) -> List[Dict[str, Any]]:
+        """Decode the games log line by line, skipping lines that don't parse"""
+        with open(self.games_file, 'rb') as f:
+            lines = f.read().split(b'\n')
+        games = []
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                games.append(orjson.loads(line))
+            except ValueError as e:
+                print(f"Skipping unreadable line {number} of {self.games_file}: {e}")
+                # A torn last line is a crashed append and is lost either way; anything
+                # earlier is kept on disk for repair by refusing to compact the log
+                if number < len(lines) - 1 or lines[-1] == b'':
+                    self._load_failed = True
+        return games
+    
+    def _write_metadata(self):
+        """Write everything except the games to the JSON file"""
+        self.data["updated_at"] = datetime.now().isoformat()
+        metadata = {key: value for key, value in self.data.items() if key != "games"}
+        with open(self.data_file, 'wb') as f:
+            f.write(_dumps(metadata, indent=True))
+    
     def _save_data(self) -> bool:
-        """Save data to JSON file"""
+        """Rewrite the games log and metadata file from memory"""
+        if self._load_failed:
+            print(f"Not rewriting {self.games_file}: it did not load cleanly")
+            return False
         try:
-            self.data["updated_at"] = datetime.now().isoformat()
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=2, default=str)
+            with open(self.games_file, 'wb') as f:
+                f.writelines(_dumps(game) + b'\n' for game in self.data["games"])
+            self._write_metadata()
+            return True
+        except Exception as e:
+            print(f"Error saving data: {e}")
+            return False
+    
+    def _append_game(self, game_data: Dict[str, Any]) -> bool:
+        """Append a single game to the games log without rewriting the others"""
+        if not os.path.exists(self.games_file):
+            # First write for a legacy single-file store: migrate every game to the log
+            return self._save_data()
+        try:
+            with open(self.games_file, 'a+b') as f:
+                # Terminate a torn last line so the new game starts on its own line
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        f.write(b'\n')
+                f.write(_dumps(game_data) + b'\n')
+            self._write_metadata()
             return True
         except Exception as e:
             print(f"Error saving data: {e}")
@@ -36,19 +119,18 @@ class DataManager:
         """Add a new game to the database"""
         try:
             # Check if game already exists
-            game_id = f"{game_data.get('date')}_{game_data.get('home_team_id')}_{game_data.get('away_team_id')}"
-            
-            for existing_game in self.data["games"]:
-                existing_id = f"{existing_game.get('date')}_{existing_game.get('home_team_id')}_{existing_game.get('away_team_id')}"
-                if existing_id == game_id:
-                    return False  # Game already exists
+            game_id = self._game_key(game_data)
+            if game_id in self._game_ids:
+                return False  # Game already exists
             
             # Add notes to game data
             game_data["notes"] = notes
             game_data["added_at"] = datetime.now().isoformat()
             
             self.data["games"].append(game_data)
-            return self._save_data()
+            self._index_game(game_data)
+            self.version = next(_versions)
+            return self._append_game(game_data)
         except Exception as e:
             print(f"Error adding game: {e}")
             return False
@@ -62,6 +144,9 @@ class DataManager:
         try:
             if 0 <= index < len(self.data["games"]):
                 self.data["games"].pop(index)
+                # Drop the removed game from the duplicate-detection set
+                self._rebuild_indexes()
+                self.version = next(_versions)
                 return self._save_data()
             return False
         except Exception as e:
@@ -98,6 +183,8 @@ class DataManager:
         """Clear all game data"""
         try:
             self.data = {"games": [], "created_at": datetime.now().isoformat()}
+            self._rebuild_indexes()
+            self.version = next(_versions)
             return self._save_data()
         except Exception as e:
             print(f"Error clearing data: {e}")
@@ -1,37 +1,150 @@
 import statsapi
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-import json
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+import orjson
+import os
+import re
+import sqlite3
+import threading
+import time
+
+# (connect, read) timeout in seconds for MLB StatsAPI requests
+REQUEST_TIMEOUT = (3, 10)
+
+# On-disk cache of StatsAPI payloads, shared across app restarts
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'mlb_aggregator', 'statsapi.sqlite3')
+# Seconds before a cached payload is refetched; finished games never change and are kept forever
+LIVE_TTL = 300
+TEAMS_TTL = 7 * 24 * 3600
+FINAL_STATUSES = frozenset({'Final', 'Game Over', 'Completed Early'})
+
+# Outs recorded for the digit after the dot in baseball innings notation
+_FRAC = {'': 0, '0': 0, '1': 1, '2': 2}
+
+# Pitching decision in a box score namefield, e.g. "Lodolo  (W, 9-8)"
+_WLS = re.compile(r'\(([WLS]),')
+
+def _safe_int(value) -> int:
+    """Convert a box score value to int, handling empty strings"""
+    if value.__class__ is int:
+        return value
+    try:
+        return int(value) if value else 0
+    except (ValueError, TypeError):
+        return 0
+
+def _parse_outs(innings) -> int:
+    """Parse baseball innings notation into outs recorded (e.g., '6.1' = 19 outs)"""
+    if not innings:
+        return 0
+    whole, _, fraction = str(innings).partition('.')
+    try:
+        outs = _FRAC.get(fraction)
+        if outs is None:
+            # Handle other cases (shouldn't happen in baseball)
+            outs = int(fraction) if fraction.isdigit() else 0
+        return (int(whole) if whole else 0) * 3 + outs
+    except ValueError:
+        return 0
+
+class _DiskCache:
+    """Key/value store in a SQLite file with optional per-entry expiry"""
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # The client is shared by every session's script thread, so serialize access with a lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, expires REAL)')
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            row = self._conn.execute('SELECT value, expires FROM cache WHERE key = ?', (key,)).fetchone()
+        if row is None or (row[1] is not None and row[1] < time.time()):
+            return None
+        return orjson.loads(row[0])
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None):
+        data = orjson.dumps(value)
+        expires = None if expire is None else time.time() + expire
+        with self._lock, self._conn:
+            self._conn.execute('INSERT OR REPLACE INTO cache VALUES (?, ?, ?)', (key, data, expires))
+
+class _PooledRequests:
+    """Stand-in for the requests module used inside statsapi that routes calls through a shared session"""
+    def __init__(self, session: requests.Session):
+        self._session = session
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        response = self._session.get(url, **kwargs)
+        # statsapi parses every payload with response.json(); orjson decodes the
+        # large box scores several times faster than the stdlib
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
 
 class MLBApiClient:
     def __init__(self):
         self.teams_cache = None
+        self._session = self._build_session()
+        # statsapi calls requests.get directly; point it at the pooled session
+        # so repeated calls reuse keep-alive connections instead of new TLS handshakes
+        statsapi.requests = _PooledRequests(self._session)
+        try:
+            self._cache = _DiskCache(CACHE_FILE)
+        except Exception as e:
+            print(f"Error opening StatsAPI cache: {e}")
+            self._cache = None
+        # In-process memo of each day's (home_id, away_id) -> game lookup
+        self._indexed_schedule = lru_cache(maxsize=512)(self._index_schedule)
+    
+    def _build_session(self) -> requests.Session:
+        """Create an HTTP session with connection pooling and retries"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        session.mount('https://', adapter)
+        return session
     
     def get_teams(self) -> List[Dict[str, Any]]:
         """Get list of all MLB teams"""
         if self.teams_cache is not None:
             return self.teams_cache
         
+        teams = self._cache_get('teams')
+        if teams:
+            self.teams_cache = teams
+            return teams
+        
         try:
             # Get teams using statsapi
             teams_data = statsapi.get('teams', {'sportId': 1})
-            teams = []
-            
-            if teams_data and 'teams' in teams_data:
-                for team in teams_data['teams']:
-                    teams.append({
-                        'id': team.get('id'),
-                        'name': team.get('name', ''),
-                        'abbreviation': team.get('abbreviation', ''),
-                        'teamName': team.get('teamName', ''),
-                        'locationName': team.get('locationName', ''),
-                        'division': team.get('division', {}).get('name', ''),
-                        'league': team.get('league', {}).get('name', '')
-                    })
+            teams = [{
+                'id': team.get('id'),
+                'name': team.get('name', ''),
+                'abbreviation': team.get('abbreviation', ''),
+                'teamName': team.get('teamName', ''),
+                'locationName': team.get('locationName', ''),
+                'division': team.get('division', {}).get('name', ''),
+                'league': team.get('league', {}).get('name', '')
+            } for team in (teams_data or {}).get('teams', [])]
             
             # Sort teams by name
-            teams.sort(key=lambda x: x['name'])
+            teams.sort(key=itemgetter('name'))
             self.teams_cache = teams
+            if teams:
+                self._cache_set('teams', teams, TEAMS_TTL)
             return teams
             
         except Exception as e:
@@ -41,22 +154,10 @@ class MLBApiClient:
     def get_game_data(self, home_team_id: int, away_team_id: int, game_date: str) -> Optional[Dict[str, Any]]:
         """Get game data for specific teams and date"""
         try:
-            # Convert date to string format if it's a date object
-            if hasattr(game_date, 'strftime'):
-                date_str = game_date.strftime('%Y-%m-%d')
-            else:
-                date_str = str(game_date)
+            date_str = self._date_str(game_date)
             
             # Get schedule for the date
-            schedule = statsapi.schedule(date=date_str)
-            
-            target_game = None
-            for game in schedule:
-                if (game.get('home_id') == home_team_id and 
-                    game.get('away_id') == away_team_id):
-                    target_game = game
-                    break
-            
+            target_game = self._schedule_index(date_str).get((home_team_id, away_team_id))
             if not target_game:
                 return None
             
@@ -64,206 +165,181 @@ class MLBApiClient:
             if not game_id:
                 return None
             
-            # Get detailed box score
-            box_score = statsapi.boxscore_data(game_id)
-            
-            # Extract game information
-            game_data = {
-                'game_id': game_id,
-                'date': date_str,
-                'home_team': target_game.get('home_name', ''),
-                'away_team': target_game.get('away_name', ''),
-                'home_team_id': home_team_id,
-                'away_team_id': away_team_id,
-                'home_score': target_game.get('home_score', 0),
-                'away_score': target_game.get('away_score', 0),
-                'game_status': target_game.get('status', ''),
-                'venue': target_game.get('venue_name', ''),
-                'home_team_batting': [],
-                'away_team_batting': [],
-                'home_team_pitching': [],
-                'away_team_pitching': []
-            }
-            
-            # Extract batting statistics from homeBatters and awayBatters
-            if 'homeBatters' in box_score:
-                for player_stats in box_score['homeBatters']:
-                    if player_stats.get('personId', 0) > 0:  # Skip header row (personId = 0)
-                        batting_data = self._extract_batting_stats(player_stats, box_score)
-                        if batting_data:
-                            game_data['home_team_batting'].append(batting_data)
-            
-            if 'awayBatters' in box_score:
-                for player_stats in box_score['awayBatters']:
-                    if player_stats.get('personId', 0) > 0:  # Skip header row (personId = 0)
-                        batting_data = self._extract_batting_stats(player_stats, box_score)
-                        if batting_data:
-                            game_data['away_team_batting'].append(batting_data)
-            
-            # Extract pitching statistics from homePitchers and awayPitchers
-            if 'homePitchers' in box_score:
-                for player_stats in box_score['homePitchers']:
-                    if player_stats.get('personId', 0) > 0:  # Skip header row (personId = 0)
-                        pitching_data = self._extract_pitching_stats(player_stats, box_score)
-                        if pitching_data:
-                            game_data['home_team_pitching'].append(pitching_data)
-            
-            if 'awayPitchers' in box_score:
-                for player_stats in box_score['awayPitchers']:
-                    if player_stats.get('personId', 0) > 0:  # Skip header row (personId = 0)
-                        pitching_data = self._extract_pitching_stats(player_stats, box_score)
-                        if pitching_data:
-                            game_data['away_team_pitching'].append(pitching_data)
+            # Get detailed box score. This needs the game_id from the schedule,
+            # so the two lookups are inherently sequential; the pooled session
+            # is what keeps the second request cheap
+            box_score = self._boxscore(game_id, target_game.get('status'))
             
-            return game_data
+            return self._build_game_data(target_game, box_score, home_team_id, away_team_id, date_str)
             
         except Exception as e:
             print(f"Error fetching game data: {e}")
             return None
     
-    def _extract_batting_stats(self, player_stats: Dict, box_score: Dict) -> Optional[Dict[str, Any]]:
-        """Extract batting statistics for a player"""
-        try:
-            player_id = str(player_stats.get('personId', ''))
-            
-            # Get player name from roster data
-            player_name = self._get_player_name(player_id, box_score)
-            
-            # Convert string values to integers, handling empty strings
-            def safe_int(value):
-                try:
-                    return int(value) if value and value != '' else 0
-                except (ValueError, TypeError):
-                    return 0
-            
-            # Get batting order and position
-            batting_order = player_stats.get('battingOrder', '')
-            position = player_stats.get('position', '')  # Position is a direct string in this API response
-            substitution = bool(player_stats.get('substitution', False))
-            
-            # Convert batting order to number (1-9) for starters
-            try:
-                # MLB API uses string like '100' for 1st, '200' for 2nd, etc.
-                order_num = int(batting_order[0]) if batting_order and not substitution else None
-            except (ValueError, IndexError):
-                order_num = None
-                
-            return {
-                'order': order_num,
-                'player_id': player_id,
-                'name': player_name,
-                'position': position,
-                'sub': substitution,
-                'at_bats': safe_int(player_stats.get('ab', 0)),
-                'hits': safe_int(player_stats.get('h', 0)),
-                'runs': safe_int(player_stats.get('r', 0)),
-                'rbis': safe_int(player_stats.get('rbi', 0)),
-                'doubles': safe_int(player_stats.get('doubles', 0)),
-                'triples': safe_int(player_stats.get('triples', 0)),
-                'home_runs': safe_int(player_stats.get('hr', 0)),
-                'walks': safe_int(player_stats.get('bb', 0)),
-                'strikeouts': safe_int(player_stats.get('k', 0)),
-                'stolen_bases': safe_int(player_stats.get('sb', 0)),
-                'caught_stealing': 0  # Not available in this format
-            }
-        except Exception as e:
-            print(f"Error extracting batting stats: {e}")
-            return None
+    @staticmethod
+    def _date_str(game_date) -> str:
+        """Convert date to string format if it's a date object"""
+        if hasattr(game_date, 'strftime'):
+            return game_date.strftime('%Y-%m-%d')
+        return str(game_date)
     
-    def _extract_pitching_stats(self, player_stats: Dict, box_score: Dict) -> Optional[Dict[str, Any]]:
-        """Extract pitching statistics for a player"""
+    def _cache_get(self, key: str) -> Any:
+        """Cached payload for key, or None on a miss or any cache error so callers fall back to statsapi"""
+        if self._cache is None:
+            return None
         try:
-            player_id = str(player_stats.get('personId', ''))
-            
-            # Get player name from roster data
-            player_name = self._get_player_name(player_id, box_score)
-            
-            # Convert string values to appropriate types, handling empty strings
-            def safe_int(value):
-                try:
-                    return int(value) if value and value != '' else 0
-                except (ValueError, TypeError):
-                    return 0
-            
-            def safe_float(value):
-                try:
-                    return float(value) if value and value != '' else 0.0
-                except (ValueError, TypeError):
-                    return 0.0
-            
-            def parse_innings(innings_str):
-                """Parse baseball innings notation (e.g., '6.1' = 6⅓ innings)"""
-                try:
-                    if not innings_str or innings_str == '':
-                        return 0.0
-                    
-                    innings_str = str(innings_str)
-                    if '.' in innings_str:
-                        whole, fraction = innings_str.split('.')
-                        whole_innings = int(whole) if whole else 0
-                        
-                        # Convert baseball fractional notation to decimal
-                        if fraction == '1':
-                            fraction_decimal = 1/3  # 1 out = 1/3 inning
-                        elif fraction == '2':
-                            fraction_decimal = 2/3  # 2 outs = 2/3 inning
-                        else:
-                            # Handle other cases (shouldn't happen in baseball)
-                            fraction_decimal = int(fraction) / 3 if fraction.isdigit() else 0
-                        
-                        return whole_innings + fraction_decimal
-                    else:
-                        return float(innings_str)
-                except (ValueError, TypeError):
-                    return 0.0
-            
-            # Parse wins/losses from namefield (e.g., "Lodolo  (W, 9-8)")
-            wins = 0
-            losses = 0
-            saves = 0
-            namefield = player_stats.get('namefield', '')
-            if '(W,' in namefield:
-                wins = 1
-            elif '(L,' in namefield:
-                losses = 1
-            elif '(S,' in namefield:
-                saves = 1
-            
-            return {
-                'player_id': player_id,
-                'name': player_name,
-                'wins': wins,
-                'losses': losses,
-                'saves': saves,
-                'innings_pitched': parse_innings(player_stats.get('ip', 0)),
-                'hits_allowed': safe_int(player_stats.get('h', 0)),
-                'runs_allowed': safe_int(player_stats.get('r', 0)),
-                'earned_runs': safe_int(player_stats.get('er', 0)),
-                'walks_allowed': safe_int(player_stats.get('bb', 0)),
-                'strikeouts': safe_int(player_stats.get('k', 0)),
-                'home_runs_allowed': safe_int(player_stats.get('hr', 0)),
-                'pitches_thrown': safe_int(player_stats.get('p', 0))
-            }
+            return self._cache.get(key)
         except Exception as e:
-            print(f"Error extracting pitching stats: {e}")
+            print(f"Error reading StatsAPI cache: {e}")
             return None
     
-    def _get_player_name(self, player_id: str, box_score: Dict) -> str:
-        """Get player name from box score data"""
+    def _cache_set(self, key: str, value: Any, expire: Optional[float]):
+        if self._cache is None:
+            return
         try:
-            # Look in player info section using the correct key format
-            if 'playerInfo' in box_score:
-                player_key = f'ID{player_id}'
-                if player_key in box_score['playerInfo']:
-                    player_info = box_score['playerInfo'][player_key]
-                    return player_info.get('fullName', f'Player {player_id}')
-            
-            # Fallback to generic name
-            return f'Player {player_id}'
-            
+            self._cache.set(key, value, expire)
         except Exception as e:
-            print(f"Error getting player name: {e}")
-            return f'Player {player_id}'
+            print(f"Error writing StatsAPI cache: {e}")
+    
+    def _schedule(self, date_str: str) -> List[Dict]:
+        """Schedule for a date, from the disk cache when available"""
+        key = f'schedule:{date_str}'
+        schedule = self._cache_get(key)
+        if schedule is None:
+            schedule = statsapi.schedule(date=date_str)
+            done = bool(schedule) and all(game.get('status') in FINAL_STATUSES for game in schedule)
+            self._cache_set(key, schedule, None if done else LIVE_TTL)
+        return schedule
+    
+    def _schedule_index(self, date_str: str) -> Dict[Tuple[Any, Any], Dict]:
+        """(home_id, away_id) -> scheduled game for a date"""
+        # Days before yesterday are settled and memoized for good; recent days
+        # get a fresh key every LIVE_TTL seconds so live scores refresh
+        settled = date_str < (date.today() - timedelta(days=1)).isoformat()
+        return self._indexed_schedule(date_str, None if settled else int(time.time() // LIVE_TTL))
+    
+    def _index_schedule(self, date_str: str, bucket: Optional[int]) -> Dict[Tuple[Any, Any], Dict]:
+        index = {}
+        for game in self._schedule(date_str):
+            # Keep the first game of a doubleheader, like the old linear scan
+            index.setdefault((game.get('home_id'), game.get('away_id')), game)
+        return index
+    
+    def _boxscore(self, game_id: int, status: Optional[str]) -> Dict:
+        """Box score for a game, from the disk cache when available"""
+        key = f'boxscore:{game_id}'
+        box_score = self._cache_get(key)
+        if box_score is None:
+            box_score = statsapi.boxscore_data(game_id)
+            self._cache_set(key, box_score, None if status in FINAL_STATUSES else LIVE_TTL)
+        return box_score
+    
+    def _build_game_data(self, target_game: Dict, box_score: Dict, home_team_id: int, away_team_id: int,
+                         date_str: str) -> Dict[str, Any]:
+        """Assemble the stored game record from a schedule entry and its box score"""
+        # Extract game information
+        game_data = {
+            'game_id': target_game.get('game_id'),
+            'date': date_str,
+            'home_team': target_game.get('home_name', ''),
+            'away_team': target_game.get('away_name', ''),
+            'home_team_id': home_team_id,
+            'away_team_id': away_team_id,
+            'home_score': target_game.get('home_score', 0),
+            'away_score': target_game.get('away_score', 0),
+            'game_status': target_game.get('status', ''),
+            'venue': target_game.get('venue_name', ''),
+            'home_team_batting': [],
+            'away_team_batting': [],
+            'home_team_pitching': [],
+            'away_team_pitching': []
+        }
+        
+        # Resolve player names once per box score instead of once per player
+        name_map = {key[2:]: info['fullName'] for key, info in box_score.get('playerInfo', {}).items()
+                    if key.startswith('ID') and 'fullName' in info}
+        
+        # Extract batting and pitching statistics from homeBatters, awayPitchers, etc.
+        # The row builders don't catch errors; callers handle them once per game
+        sections = (('batting', 'Batters', self._batting_row),
+                    ('pitching', 'Pitchers', self._pitching_row))
+        for side in ('home', 'away'):
+            for kind, box_key, row in sections:
+                rows = game_data[f'{side}_team_{kind}']
+                for player_stats in box_score.get(f'{side}{box_key}', ()):
+                    if player_stats.get('personId', 0) > 0:  # Skip header row (personId = 0)
+                        rows.append(row(player_stats, name_map))
+        
+        return game_data
+    
+    def _batting_row(self, player_stats: Dict, name_map: Dict[str, str]) -> Dict[str, Any]:
+        """Extract batting statistics for a player"""
+        get = player_stats.get  # bound once; called for every field below
+        player_id = str(get('personId', ''))
+        
+        # Get player name from roster data
+        player_name = name_map.get(player_id, f'Player {player_id}')
+        
+        # Get batting order and position
+        batting_order = str(get('battingOrder') or '')
+        position = get('position', '')  # Position is a direct string in this API response
+        substitution = bool(get('substitution', False))
+        
+        # Convert batting order to number (1-9) for starters
+        # MLB API uses string like '100' for 1st, '200' for 2nd, etc.
+        order_num = int(batting_order[0]) if batting_order[:1].isdigit() and not substitution else None
+        
+        return {
+            'order': order_num,
+            'player_id': player_id,
+            'name': player_name,
+            'position': position,
+            'sub': substitution,
+            'at_bats': _safe_int(get('ab', 0)),
+            'hits': _safe_int(get('h', 0)),
+            'runs': _safe_int(get('r', 0)),
+            'rbis': _safe_int(get('rbi', 0)),
+            'doubles': _safe_int(get('doubles', 0)),
+            'triples': _safe_int(get('triples', 0)),
+            'home_runs': _safe_int(get('hr', 0)),
+            'walks': _safe_int(get('bb', 0)),
+            'strikeouts': _safe_int(get('k', 0)),
+            'stolen_bases': _safe_int(get('sb', 0)),
+            'caught_stealing': 0  # Not available in this format
+        }
+    
+    def _pitching_row(self, player_stats: Dict, name_map: Dict[str, str]) -> Dict[str, Any]:
+        """Extract pitching statistics for a player"""
+        get = player_stats.get  # bound once; called for every field below
+        player_id = str(get('personId', ''))
+        
+        # Get player name from roster data
+        player_name = name_map.get(player_id, f'Player {player_id}')
+        
+        # Parse wins/losses from namefield (e.g., "Lodolo  (W, 9-8)")
+        decision = _WLS.search(str(get('namefield') or ''))
+        decision = decision.group(1) if decision else ''
+        wins = int(decision == 'W')
+        losses = int(decision == 'L')
+        saves = int(decision == 'S')
+        outs = _parse_outs(get('ip', 0))
+        
+        return {
+            'player_id': player_id,
+            'name': player_name,
+            'wins': wins,
+            'losses': losses,
+            'saves': saves,
+            'innings_pitched': outs / 3,
+            'outs_recorded': outs,
+            'hits_allowed': _safe_int(get('h', 0)),
+            'runs_allowed': _safe_int(get('r', 0)),
+            'earned_runs': _safe_int(get('er', 0)),
+            'walks_allowed': _safe_int(get('bb', 0)),
+            'strikeouts': _safe_int(get('k', 0)),
+            'home_runs_allowed': _safe_int(get('hr', 0)),
+            'pitches_thrown': _safe_int(get('p', 0))
+        }
     
     def get_player_info(self, player_id: int) -> Optional[Dict[str, Any]]:
         """Get detailed player information"""
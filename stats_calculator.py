@@ -1,6 +1,18 @@
-from typing import List, Dict, Any, Tuple
-import pandas as pd
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple
 from collections import defaultdict
+import orjson
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Summed per player, in output column order, with the dtype each is coerced to
+_BATTING_FIELDS = dict.fromkeys(
+    ('at_bats', 'hits', 'runs', 'rbis', 'doubles', 'triples', 'home_runs', 'walks', 'strikeouts'), 'int64')
+_PITCHING_FIELDS = {
+    'wins': 'int64', 'losses': 'int64', 'saves': 'int64', 'outs_recorded': 'int64',
+    'hits_allowed': 'int64', 'runs_allowed': 'int64', 'earned_runs': 'int64',
+    'walks_allowed': 'int64', 'strikeouts': 'int64', 'home_runs_allowed': 'int64'
+}
 
 class StatsCalculator:
     def __init__(self):
@@ -8,188 +20,77 @@ class StatsCalculator:
     
     def calculate_aggregate_stats(self, games: List[Dict[str, Any]]) -> Tuple[List[Dict], List[Dict]]:
         """Calculate aggregate batting and pitching statistics from all games"""
-        batting_stats = defaultdict(lambda: {
-            'player_name': '',
-            'team': '',
-            'games': 0,
-            'at_bats': 0,
-            'hits': 0,
-            'runs': 0,
-            'rbis': 0,
-            'doubles': 0,
-            'triples': 0,
-            'home_runs': 0,
-            'walks': 0,
-            'strikeouts': 0,
-            'batting_average': 0.0,
-            'on_base_percentage': 0.0,
-            'slugging_percentage': 0.0,
-            'ops': 0.0
-        })
-        
-        pitching_stats = defaultdict(lambda: {
-            'player_name': '',
-            'team': '',
-            'games': 0,
-            'wins': 0,
-            'losses': 0,
-            'saves': 0,
-            'innings_pitched': 0.0,
-            'hits_allowed': 0,
-            'runs_allowed': 0,
-            'earned_runs': 0,
-            'walks_allowed': 0,
-            'strikeouts': 0,
-            'home_runs_allowed': 0,
-            'era': 0.0,
-            'whip': 0.0
-        })
-        
-        # Process each game
-        for game in games:
-            self._process_game_batting_stats(game, batting_stats)
-            self._process_game_pitching_stats(game, pitching_stats)
+        batting = self._player_totals(games, 'batting', _BATTING_FIELDS)
+        pitching = self._player_totals(games, 'pitching', _PITCHING_FIELDS)
         
         # Calculate derived statistics
-        batting_list = self._calculate_batting_averages(batting_stats)
-        pitching_list = self._calculate_pitching_averages(pitching_stats)
+        batting_list = self._calculate_batting_averages(batting) if batting is not None else []
+        pitching_list = self._calculate_pitching_averages(pitching) if pitching is not None else []
         
         return batting_list, pitching_list
     
-    def _process_game_batting_stats(self, game: Dict[str, Any], batting_stats: defaultdict):
-        """Process batting statistics from a single game"""
-        # Process home team batting
-        home_batting = game.get('home_team_batting', [])
-        for player in home_batting:
-            player_id = player.get('player_id', f"unknown_{player.get('name', 'unnamed')}")
-            
-            stats = batting_stats[player_id]
-            stats['player_name'] = player.get('name', 'Unknown')
-            stats['team'] = game.get('home_team', 'Unknown')
-            stats['games'] += 1
-            
-            # Add batting statistics
-            stats['at_bats'] += int(player.get('at_bats', 0))
-            stats['hits'] += int(player.get('hits', 0))
-            stats['runs'] += int(player.get('runs', 0))
-            stats['rbis'] += int(player.get('rbis', 0))
-            stats['doubles'] += int(player.get('doubles', 0))
-            stats['triples'] += int(player.get('triples', 0))
-            stats['home_runs'] += int(player.get('home_runs', 0))
-            stats['walks'] += int(player.get('walks', 0))
-            stats['strikeouts'] += int(player.get('strikeouts', 0))
+    def _player_totals(self, games: List[Dict[str, Any]], kind: str, fields: Dict[str, str]) -> Optional['pd.DataFrame']:
+        """Sum each player's box score lines across games, one row per player in order of first appearance"""
+        rows = []
+        teams = []
+        for game in games:
+            for side in ('home', 'away'):
+                players = game.get(f'{side}_team_{kind}', [])
+                rows.extend(players)
+                teams.extend([game.get(f'{side}_team', 'Unknown')] * len(players))
+        if not rows:
+            return None
         
-        # Process away team batting
-        away_batting = game.get('away_team_batting', [])
-        for player in away_batting:
-            player_id = player.get('player_id', f"unknown_{player.get('name', 'unnamed')}")
-            
-            stats = batting_stats[player_id]
-            stats['player_name'] = player.get('name', 'Unknown')
-            stats['team'] = game.get('away_team', 'Unknown')
-            stats['games'] += 1
-            
-            # Add batting statistics
-            stats['at_bats'] += int(player.get('at_bats', 0))
-            stats['hits'] += int(player.get('hits', 0))
-            stats['runs'] += int(player.get('runs', 0))
-            stats['rbis'] += int(player.get('rbis', 0))
-            stats['doubles'] += int(player.get('doubles', 0))
-            stats['triples'] += int(player.get('triples', 0))
-            stats['home_runs'] += int(player.get('home_runs', 0))
-            stats['walks'] += int(player.get('walks', 0))
-            stats['strikeouts'] += int(player.get('strikeouts', 0))
-    
-    def _process_game_pitching_stats(self, game: Dict[str, Any], pitching_stats: defaultdict):
-        """Process pitching statistics from a single game"""
-        # Process home team pitching
-        home_pitching = game.get('home_team_pitching', [])
-        for player in home_pitching:
-            player_id = player.get('player_id', f"unknown_{player.get('name', 'unnamed')}")
-            
-            stats = pitching_stats[player_id]
-            stats['player_name'] = player.get('name', 'Unknown')
-            stats['team'] = game.get('home_team', 'Unknown')
-            stats['games'] += 1
-            
-            # Add pitching statistics
-            stats['wins'] += int(player.get('wins', 0))
-            stats['losses'] += int(player.get('losses', 0))
-            stats['saves'] += int(player.get('saves', 0))
-            stats['innings_pitched'] += float(player.get('innings_pitched', 0))
-            stats['hits_allowed'] += int(player.get('hits_allowed', 0))
-            stats['runs_allowed'] += int(player.get('runs_allowed', 0))
-            stats['earned_runs'] += int(player.get('earned_runs', 0))
-            stats['walks_allowed'] += int(player.get('walks_allowed', 0))
-            stats['strikeouts'] += int(player.get('strikeouts', 0))
-            stats['home_runs_allowed'] += int(player.get('home_runs_allowed', 0))
+        # Deferred so importing this module stays cheap for callers that never aggregate
+        import pandas as pd
+        columns = ['player_id', 'name', *fields]
+        if 'outs_recorded' in fields:
+            columns.append('innings_pitched')
+        lines = pd.DataFrame.from_records(rows, columns=columns)
+        if 'outs_recorded' in fields:
+            # Lines saved before outs were stored only carry fractional innings
+            lines['outs_recorded'] = lines['outs_recorded'].fillna((lines['innings_pitched'] * 3).round())
+        lines['player_id'] = lines['player_id'].fillna('unknown_' + lines['name'].fillna('unnamed').astype(str))
+        lines['name'] = lines['name'].fillna('Unknown')
+        lines['team'] = teams
+        lines = lines.fillna(dict.fromkeys(fields, 0)).astype(fields)
         
-        # Process away team pitching
-        away_pitching = game.get('away_team_pitching', [])
-        for player in away_pitching:
-            player_id = player.get('player_id', f"unknown_{player.get('name', 'unnamed')}")
-            
-            stats = pitching_stats[player_id]
-            stats['player_name'] = player.get('name', 'Unknown')
-            stats['team'] = game.get('away_team', 'Unknown')
-            stats['games'] += 1
-            
-            # Add pitching statistics
-            stats['wins'] += int(player.get('wins', 0))
-            stats['losses'] += int(player.get('losses', 0))
-            stats['saves'] += int(player.get('saves', 0))
-            stats['innings_pitched'] += float(player.get('innings_pitched', 0))
-            stats['hits_allowed'] += int(player.get('hits_allowed', 0))
-            stats['runs_allowed'] += int(player.get('runs_allowed', 0))
-            stats['earned_runs'] += int(player.get('earned_runs', 0))
-            stats['walks_allowed'] += int(player.get('walks_allowed', 0))
-            stats['strikeouts'] += int(player.get('strikeouts', 0))
-            stats['home_runs_allowed'] += int(player.get('home_runs_allowed', 0))
+        grouped = lines.groupby('player_id', sort=False)
+        totals = grouped[list(fields)].sum()
+        totals.insert(0, 'games', grouped.size())
+        totals.insert(0, 'team', grouped['team'].last())
+        totals.insert(0, 'player_name', grouped['name'].last())
+        return totals.reset_index(drop=True)
+    
+    @staticmethod
+    def _ratio(numerator: 'pd.Series', denominator: 'pd.Series', digits: int) -> 'pd.Series':
+        """Rounded numerator / denominator, 0.0 where the denominator is zero"""
+        return (numerator / denominator.where(denominator > 0)).round(digits).fillna(0.0)
     
-    def _calculate_batting_averages(self, batting_stats: defaultdict) -> List[Dict]:
+    def _calculate_batting_averages(self, stats: 'pd.DataFrame') -> List[Dict]:
         """Calculate batting averages and derived statistics"""
-        batting_list = []
+        stats['batting_average'] = self._ratio(stats['hits'], stats['at_bats'], 3)
         
-        for player_id, stats in batting_stats.items():
-            # Calculate batting average
-            if stats['at_bats'] > 0:
-                stats['batting_average'] = round(stats['hits'] / stats['at_bats'], 3)
-            
-            # Calculate on-base percentage
-            plate_appearances = stats['at_bats'] + stats['walks']
-            if plate_appearances > 0:
-                on_base = stats['hits'] + stats['walks']
-                stats['on_base_percentage'] = round(on_base / plate_appearances, 3)
-            
-            # Calculate slugging percentage
-            if stats['at_bats'] > 0:
-                total_bases = (stats['hits'] - stats['doubles'] - stats['triples'] - stats['home_runs'] +
-                              (stats['doubles'] * 2) + (stats['triples'] * 3) + (stats['home_runs'] * 4))
-                stats['slugging_percentage'] = round(total_bases / stats['at_bats'], 3)
-            
-            # Calculate OPS
-            stats['ops'] = round(stats['on_base_percentage'] + stats['slugging_percentage'], 3)
-            
-            batting_list.append(dict(stats))
+        plate_appearances = stats['at_bats'] + stats['walks']
+        stats['on_base_percentage'] = self._ratio(stats['hits'] + stats['walks'], plate_appearances, 3)
+        
+        # Singles count once, so each extra-base hit only adds its extra bases on top of hits
+        total_bases = stats['hits'] + stats['doubles'] + 2 * stats['triples'] + 3 * stats['home_runs']
+        stats['slugging_percentage'] = self._ratio(total_bases, stats['at_bats'], 3)
         
-        return batting_list
+        stats['ops'] = (stats['on_base_percentage'] + stats['slugging_percentage']).round(3)
+        
+        return stats.to_dict('records')
     
-    def _calculate_pitching_averages(self, pitching_stats: defaultdict) -> List[Dict]:
+    def _calculate_pitching_averages(self, stats: 'pd.DataFrame') -> List[Dict]:
         """Calculate pitching averages and derived statistics"""
-        pitching_list = []
-        
-        for player_id, stats in pitching_stats.items():
-            # Calculate ERA
-            if stats['innings_pitched'] > 0:
-                stats['era'] = round((stats['earned_runs'] * 9) / stats['innings_pitched'], 2)
-            
-            # Calculate WHIP
-            if stats['innings_pitched'] > 0:
-                stats['whip'] = round((stats['hits_allowed'] + stats['walks_allowed']) / stats['innings_pitched'], 2)
-            
-            pitching_list.append(dict(stats))
+        # Outs are summed exactly; convert to innings only for the output
+        outs = stats.pop('outs_recorded')
+        stats.insert(stats.columns.get_loc('saves') + 1, 'innings_pitched', outs / 3)
+        stats['era'] = self._ratio(stats['earned_runs'] * 27, outs, 2)
+        stats['whip'] = self._ratio((stats['hits_allowed'] + stats['walks_allowed']) * 3, outs, 2)
         
-        return pitching_list
+        return stats.to_dict('records')
     
     def get_team_summary(self, games: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Get summary statistics for all teams"""
@@ -201,14 +102,23 @@ class StatsCalculator:
             home_score = int(game.get('home_score', 0))
             away_score = int(game.get('away_score', 0))
             
-            team_records[home_team]['games_seen'] += 1
-            team_records[away_team]['games_seen'] += 1
+            home_record = team_records[home_team]
+            away_record = team_records[away_team]
+            
+            home_record['games_seen'] += 1
+            away_record['games_seen'] += 1
             
             if home_score > away_score:
-                team_records[home_team]['wins'] += 1
-                team_records[away_team]['losses'] += 1
+                home_record['wins'] += 1
+                away_record['losses'] += 1
             elif away_score > home_score:
-                team_records[away_team]['wins'] += 1
-                team_records[home_team]['losses'] += 1
+                away_record['wins'] += 1
+                home_record['losses'] += 1
         
         return dict(team_records)
+    
+    def to_json_bytes(self, batting: List[Dict], pitching: List[Dict], **extra: Any) -> bytes:
+        """Serialize aggregated stats, plus any extra top-level fields, as indented JSON"""
+        data = {'batting_stats': batting, 'pitching_stats': pitching, **extra}
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, default=str, option=option)